@@ -0,0 +1,39 @@
+"""Booking-specific database interface — joins each booking with its room.
+
+Intentional upgrades from transcript:
+  - Reads join rooms in a single SELECT, so listing bookings with their room
+    number never falls into the N+1 pattern of one read_by_id per booking
+  - LEFT OUTER JOIN: a booking whose room row is gone is still listed, with
+    room_number None (SQLite does not enforce the foreign key here)
+  - Writes are inherited unchanged from the generic DBInterface
+"""
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from db.db_interface import DataObject, DBInterface
+from db.models import DBBooking, DBRoom
+
+
+class DBBookingInterface(DBInterface):
+    __slots__ = ()
+
+    def __init__(self, db_session: Session):
+        super().__init__(db_session, DBBooking)
+
+    def _select_joined(self) -> Select:
+        return select(
+            *DBBooking.__table__.columns, DBRoom.number.label("room_number")
+        ).outerjoin(DBRoom, DBBooking.room_id == DBRoom.id)
+
+    def read_by_id(self, id: str) -> DataObject:
+        stmt = self._select_joined().where(DBBooking.id == id)
+        row = self.db_session.execute(stmt).mappings().one_or_none()
+        if row is None:
+            raise KeyError(f"Not found: {id}")
+        return dict(row)
+
+    def read_all(self, limit: int | None = None, offset: int = 0) -> list[DataObject]:
+        stmt = self._select_joined().order_by(DBBooking.id).limit(limit).offset(offset)
+        rows = self.db_session.execute(stmt).mappings().all()
+        return [dict(row) for row in rows]
@@ -2,26 +2,51 @@
 
 Intentional upgrades from transcript:
   - Session injected via __init__ (transcript used global db_session import)
-  - SQLAlchemy 2.0 API: session.get() and session.scalars(select()) replace
-    legacy session.query().get() and session.query().all()
+  - SQLAlchemy 2.0 API: session.get() replaces legacy session.query().get()
   - KeyError raised on missing objects (transcript returned None silently)
   - delete() returns None (transcript returned the deleted object)
   - to_dict() lives here rather than in models.py for colocation with DBInterface
+  - to_dict() uses a per-model builder (attrgetter over the column names, made
+    once per class) instead of reflecting on __table__.columns for every row
+  - read_all() selects table columns as mappings, skipping ORM object hydration
+  - create() and update() use INSERT/UPDATE ... RETURNING, so no refresh
+    SELECT runs after commit
+  - create_many() inserts a batch of rows in one statement and one commit
+  - __slots__ on DBInterface: routers build one per request, so no per-instance
+    __dict__ is allocated
 """
 
+from collections.abc import Callable
+from operator import attrgetter
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
 DataObject = dict[str, Any]
 
+_DICT_BUILDERS: dict[type, Callable[[Any], DataObject]] = {}
+
+
+def _make_dict_builder(db_class: type) -> Callable[[Any], DataObject]:
+    names = tuple(col.name for col in db_class.__table__.columns)
+    get_values = attrgetter(*names)
+    if len(names) == 1:
+        return lambda obj: {names[0]: get_values(obj)}
+    return lambda obj: dict(zip(names, get_values(obj)))
+
 
 def to_dict(obj) -> DataObject:
-    return {col.name: getattr(obj, col.name) for col in obj.__table__.columns}
+    db_class = type(obj)
+    builder = _DICT_BUILDERS.get(db_class)
+    if builder is None:
+        builder = _DICT_BUILDERS[db_class] = _make_dict_builder(db_class)
+    return builder(obj)
 
 
 class DBInterface:
+    __slots__ = ("db_session", "db_class")
+
     def __init__(self, db_session: Session, db_class: type):
         self.db_session = db_session
         self.db_class = db_class
@@ -32,24 +57,49 @@ class DBInterface:
             raise KeyError(f"Not found: {id}")
         return to_dict(obj)
 
-    def read_all(self) -> list[DataObject]:
-        objects = self.db_session.scalars(select(self.db_class)).all()
-        return [to_dict(obj) for obj in objects]
+    def read_all(self, limit: int | None = None, offset: int = 0) -> list[DataObject]:
+        table = self.db_class.__table__
+        stmt = (
+            select(*table.columns)
+            .order_by(*table.primary_key.columns)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = self.db_session.execute(stmt).mappings().all()
+        return [dict(row) for row in rows]
 
     def create(self, data: DataObject) -> DataObject:
-        obj = self.db_class(**data)
-        self.db_session.add(obj)
+        columns = self.db_class.__table__.columns
+        stmt = insert(self.db_class).values(**data).returning(*columns)
+        row = self.db_session.execute(stmt).mappings().one()
         self.db_session.commit()
-        return to_dict(obj)
+        return dict(row)
+
+    def create_many(self, data: list[DataObject]) -> list[DataObject]:
+        if not data:
+            return []
+        columns = self.db_class.__table__.columns
+        stmt = insert(self.db_class).returning(*columns)
+        rows = self.db_session.execute(stmt, data).mappings().all()
+        self.db_session.commit()
+        return [dict(row) for row in rows]
 
     def update(self, id: str, data: DataObject) -> DataObject:
-        obj = self.db_session.get(self.db_class, id)
-        if obj is None:
+        if not data:
+            return self.read_by_id(id)
+        table = self.db_class.__table__
+        (primary_key,) = table.primary_key.columns
+        stmt = (
+            update(self.db_class)
+            .where(primary_key == id)
+            .values(**data)
+            .returning(*table.columns)
+        )
+        row = self.db_session.execute(stmt).mappings().one_or_none()
+        if row is None:
             raise KeyError(f"Not found: {id}")
-        for key, value in data.items():
-            setattr(obj, key, value)
         self.db_session.commit()
-        return to_dict(obj)
+        return dict(row)
 
     def delete(self, id: str) -> None:
         obj = self.db_session.get(self.db_class, id)
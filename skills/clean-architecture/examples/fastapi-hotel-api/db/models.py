@@ -6,16 +6,20 @@ Intentional upgrades from transcript:
   - Customer simplified to name/email (transcript had first_name/last_name/email_address)
   - relationship() declarations omitted — not needed when using DataInterface dict pattern
   - Column lengths omitted for SQLite (transcript used String(250))
+  - Primary keys default to new_id() (UUIDv7), assigned by SQLAlchemy on insert
+  - bookings indexed on customer_id and on (room_id, from_date, to_date) so joins
+    and room availability checks use index lookups instead of table scans
 """
 
-from sqlalchemy import Column, Date, ForeignKey, Integer, String
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, String
 
 from db.database import Base
+from ids import new_id
 
 
 class DBRoom(Base):
     __tablename__ = "rooms"
-    id = Column(String, primary_key=True)
+    id = Column(String, primary_key=True, default=new_id)
     number = Column(String, nullable=False)
     size = Column(Integer, nullable=False)
     price = Column(Integer, nullable=False)
@@ -23,16 +27,20 @@ class DBRoom(Base):
 
 class DBCustomer(Base):
     __tablename__ = "customers"
-    id = Column(String, primary_key=True)
+    id = Column(String, primary_key=True, default=new_id)
     name = Column(String, nullable=False)
     email = Column(String, nullable=False)
 
 
 class DBBooking(Base):
     __tablename__ = "bookings"
-    id = Column(String, primary_key=True)
+    id = Column(String, primary_key=True, default=new_id)
     room_id = Column(String, ForeignKey("rooms.id"), nullable=False)
-    customer_id = Column(String, ForeignKey("customers.id"), nullable=False)
+    customer_id = Column(String, ForeignKey("customers.id"), nullable=False, index=True)
     from_date = Column(Date, nullable=False)
     to_date = Column(Date, nullable=False)
     price = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_bookings_room_dates", "room_id", "from_date", "to_date"),
+    )
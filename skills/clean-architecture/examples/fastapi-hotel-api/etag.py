@@ -0,0 +1,35 @@
+"""Conditional GET helper — ETag / If-None-Match for JSON bodies.
+
+Intentional upgrades from transcript:
+  - New: read endpoints tag their JSON body with a content hash and answer
+    304 Not Modified when the client already holds that version
+  - ETag derived from the serialized body, so no version column is needed in
+    the database schema
+  - Top-level helper module rather than part of routers/, which holds only
+    APIRouter modules
+"""
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return any(tag in ("*", etag) for tag in candidates)
+
+
+def json_response_with_etag(request: Request, body: bytes) -> Response:
+    etag = make_etag(body)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=body, media_type="application/json", headers={"ETag": etag}
+    )
@@ -0,0 +1,55 @@
+"""Identifier generation for new records.
+
+Intentional upgrades from transcript:
+  - Time-ordered UUIDv7 strings replace random uuid4 (transcript relied on DB
+    autoincrement) — new keys sort after existing ones, so primary-key index
+    inserts stay append-only instead of landing on random B-tree pages
+  - Monotonic within a process: ids made in the same millisecond carry an
+    incrementing 12-bit counter in rand_a (RFC 9562 section 6.2, method 1), so
+    every id sorts after the one generated before it
+  - Top-level module shared by db/ (column defaults) and operations/ (the
+    stub), so the persistence layer never imports from the operations layer
+"""
+
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_timestamp_ms = 0
+_last_counter = 0
+
+
+def _next_timestamp_and_counter() -> tuple[int, int]:
+    global _last_timestamp_ms, _last_counter
+    with _lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _last_timestamp_ms:
+            # Random start in the lower half leaves room to count upwards.
+            counter = int.from_bytes(os.urandom(2), "big") >> 5
+        else:
+            # Same millisecond (or the clock stepped back): keep the last
+            # timestamp and count on, borrowing the next ms on overflow.
+            timestamp_ms = _last_timestamp_ms
+            counter = _last_counter + 1
+            if counter > 0xFFF:
+                timestamp_ms += 1
+                counter = 0
+        _last_timestamp_ms, _last_counter = timestamp_ms, counter
+    return timestamp_ms, counter
+
+
+def uuid7() -> uuid.UUID:
+    """Build an RFC 9562 UUIDv7: 48-bit ms timestamp, 12-bit counter, 62 random bits."""
+    timestamp_ms, counter = _next_timestamp_and_counter()
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version 7
+    value |= counter << 64
+    value |= 0x2 << 62  # RFC 4122 variant
+    value |= int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    return str(uuid7())
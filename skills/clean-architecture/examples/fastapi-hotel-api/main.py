@@ -3,19 +3,25 @@
 Intentional upgrades from transcript:
   - lifespan context manager replaces deprecated @app.on_event("startup")
   - Flat imports (no hotel.* package prefix) for standalone example clarity
+  - Blocking schema creation runs in the threadpool, keeping the event loop free
+  - Startup only creates missing tables (see db.database.create_tables)
+  - OpenAPI schema built during startup, so the first /docs or /openapi.json
+    request is served from app.openapi_schema instead of generating it
 """
 
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 
-from db.database import Base, engine
+from db.database import create_tables
 from routers import bookings, customers, rooms
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
+    await run_in_threadpool(create_tables)
+    app.openapi()
     yield
 
 
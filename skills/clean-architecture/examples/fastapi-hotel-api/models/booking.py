@@ -5,6 +5,7 @@ Intentional upgrades from transcript:
   - Class name BookingCreate (transcript used BookingCreateData)
   - String IDs (transcript used int)
   - Defined in separate models/ directory (transcript defined in operations file)
+  - Booking carries the booked room's number (optional, filled by joined reads)
 """
 
 from datetime import date
@@ -26,3 +27,4 @@ class Booking(BaseModel):
     from_date: date
     to_date: date
     price: int
+    room_number: str | None = None
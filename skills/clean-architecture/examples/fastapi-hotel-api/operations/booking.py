@@ -5,12 +5,11 @@ Intentional upgrades from transcript:
   - Uses model_dump() (Pydantic v2) instead of dataclass .dict()
   - "nights" variable name (transcript used "days")
   - data_interface parameter name (transcript used "booking_interface")
-  - UUID generation for IDs (transcript relied on DB autoincrement)
+  - IDs assigned by the data interface on create (transcript relied on DB autoincrement)
   - InvalidDateError validation not included — add if date validation is needed
+  - Returned bookings are built with model_construct() from trusted stored rows
 """
 
-import uuid
-
 from models.booking import Booking, BookingCreate
 from operations.interface import DataInterface
 
@@ -25,20 +24,19 @@ def create_booking(
     price = nights * room["price"]
 
     booking_data = data.model_dump()
-    booking_data["id"] = str(uuid.uuid4())
     booking_data["price"] = price
     created = data_interface.create(booking_data)
-    return Booking(**created)
+    return Booking.model_construct(**created, room_number=room["number"])
 
 
 def read_all_bookings(data_interface: DataInterface) -> list[Booking]:
     bookings = data_interface.read_all()
-    return [Booking(**b) for b in bookings]
+    return [Booking.model_construct(**b) for b in bookings]
 
 
 def read_booking(booking_id: str, data_interface: DataInterface) -> Booking:
     booking = data_interface.read_by_id(booking_id)
-    return Booking(**booking)
+    return Booking.model_construct(**booking)
 
 
 def delete_booking(booking_id: str, data_interface: DataInterface) -> None:
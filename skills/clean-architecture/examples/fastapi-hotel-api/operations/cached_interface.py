@@ -0,0 +1,107 @@
+"""Read-through cache that wraps any DataInterface implementation.
+
+Intentional upgrades from transcript:
+  - Decorator over the DataInterface Protocol — operations and routers see the
+    same five methods, so caching is added at the composition root only
+  - Lives in operations/ beside the Protocol it decorates, so db/ never
+    imports from the operations layer
+  - Reads are kept for ttl seconds; every write clears the whole cache
+  - Each clear bumps a generation counter, and a read only stores its result if
+    no write cleared the cache while it was querying — a slow read that raced
+    a write cannot put the old row back for a full ttl
+  - ReadCache holds at most maxsize entries: when full, expired entries are
+    dropped first, then the oldest, so paging through arbitrary offsets cannot
+    grow it without bound between writes
+  - The ReadCache is passed in, letting one module-level cache outlive the
+    per-request interfaces built around it
+"""
+
+import threading
+import time
+from typing import Any
+
+from operations.interface import DataInterface, DataObject
+
+_MISSING: Any = object()
+
+
+class ReadCache:
+    __slots__ = ("entries", "generation", "lock", "maxsize")
+
+    def __init__(self, maxsize: int = 1024):
+        self.entries: dict[Any, tuple[float, Any]] = {}
+        self.maxsize = maxsize
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+
+    def make_room(self, now: float) -> None:
+        """Free one slot if full; caller holds the lock."""
+        if len(self.entries) < self.maxsize:
+            return
+        expired = [key for key, (expires, _) in self.entries.items() if expires < now]
+        for key in expired:
+            del self.entries[key]
+        if len(self.entries) >= self.maxsize:
+            del self.entries[next(iter(self.entries))]
+
+
+class CachedDataInterface:
+    __slots__ = ("data_interface", "cache", "ttl")
+
+    def __init__(
+        self, data_interface: DataInterface, cache: ReadCache, ttl: float = 60.0
+    ):
+        self.data_interface = data_interface
+        self.cache = cache
+        self.ttl = ttl
+
+    def _get(self, key: Any) -> Any:
+        entry = self.cache.entries.get(key, _MISSING)
+        if entry is _MISSING or entry[0] < time.monotonic():
+            return _MISSING
+        return entry[1]
+
+    def _put(self, key: Any, value: Any, generation: int) -> Any:
+        now = time.monotonic()
+        with self.cache.lock:
+            if self.cache.generation == generation:
+                self.cache.entries.pop(key, None)
+                self.cache.make_room(now)
+                self.cache.entries[key] = (now + self.ttl, value)
+        return value
+
+    def read_by_id(self, id: str) -> DataObject:
+        obj = self._get(id)
+        if obj is _MISSING:
+            generation = self.cache.generation
+            obj = self._put(id, self.data_interface.read_by_id(id), generation)
+        return obj
+
+    def read_all(self, limit: int | None = None, offset: int = 0) -> list[DataObject]:
+        key = ("__all__", limit, offset)
+        objects = self._get(key)
+        if objects is _MISSING:
+            generation = self.cache.generation
+            objects = self._put(
+                key, self.data_interface.read_all(limit, offset), generation
+            )
+        return objects
+
+    def create(self, data: DataObject) -> DataObject:
+        created = self.data_interface.create(data)
+        self.cache.clear()
+        return created
+
+    def update(self, id: str, data: DataObject) -> DataObject:
+        updated = self.data_interface.update(id, data)
+        self.cache.clear()
+        return updated
+
+    def delete(self, id: str) -> None:
+        self.data_interface.delete(id)
+        self.cache.clear()
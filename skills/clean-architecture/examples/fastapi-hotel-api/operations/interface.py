@@ -6,44 +6,62 @@ Intentional upgrades from transcript:
   - DataInterfaceStub is a full in-memory dict implementation — usable directly
     in tests without subclassing (transcript taught a NotImplementedError base
     class that required per-test subclasses)
+  - create() assigns an id when the caller leaves it out, mirroring the DB
+    column default
+  - Lookups probe the dict once (get/pop with a sentinel default) rather than
+    an "in" check followed by indexing
+  - read_all() takes limit/offset so list endpoints can page through results
 """
 
+from itertools import islice
 from typing import Any, Protocol
 
+from ids import new_id
+
 DataObject = dict[str, Any]
 
+_MISSING: Any = object()
+
 
 class DataInterface(Protocol):
     def read_by_id(self, id: str) -> DataObject: ...
-    def read_all(self) -> list[DataObject]: ...
+    def read_all(
+        self, limit: int | None = None, offset: int = 0
+    ) -> list[DataObject]: ...
     def create(self, data: DataObject) -> DataObject: ...
     def update(self, id: str, data: DataObject) -> DataObject: ...
     def delete(self, id: str) -> None: ...
 
 
 class DataInterfaceStub:
+    __slots__ = ("data",)
+
     def __init__(self):
         self.data: dict[str, DataObject] = {}
 
     def read_by_id(self, id: str) -> DataObject:
-        if id not in self.data:
+        obj = self.data.get(id, _MISSING)
+        if obj is _MISSING:
             raise KeyError(f"Not found: {id}")
-        return self.data[id]
+        return obj
 
-    def read_all(self) -> list[DataObject]:
-        return list(self.data.values())
+    def read_all(self, limit: int | None = None, offset: int = 0) -> list[DataObject]:
+        stop = None if limit is None else offset + limit
+        return list(islice(self.data.values(), offset, stop))
 
     def create(self, data: DataObject) -> DataObject:
+        if "id" not in data:
+            data["id"] = new_id()
         self.data[data["id"]] = data
         return data
 
     def update(self, id: str, data: DataObject) -> DataObject:
-        if id not in self.data:
+        obj = self.data.get(id, _MISSING)
+        if obj is _MISSING:
             raise KeyError(f"Not found: {id}")
-        self.data[id].update(data)
-        return self.data[id]
+        obj.update(data)
+        return obj
 
     def delete(self, id: str) -> None:
-        if id not in self.data:
+        if self.data.pop(id, _MISSING) is _MISSING:
             raise KeyError(f"Not found: {id}")
-        del self.data[id]
@@ -5,29 +5,32 @@ Intentional upgrades from transcript:
   - Full CRUD (transcript only showed read_all_rooms and read_room)
   - create_room, update_room, delete_room added for completeness
   - RoomUpdate with exclude_none=True enables partial updates
+  - read_all_rooms() pages with limit/offset instead of loading every room
+  - Results use Room.model_construct(): rows coming back from the DataInterface
+    already match the schema (input was validated as RoomCreate/RoomUpdate), so
+    re-validating them is wasted work
 """
 
-import uuid
-
 from models.room import Room, RoomCreate, RoomUpdate
 from operations.interface import DataInterface
 
 
-def read_all_rooms(data_interface: DataInterface) -> list[Room]:
-    rooms = data_interface.read_all()
-    return [Room(**room) for room in rooms]
+def read_all_rooms(
+    data_interface: DataInterface, limit: int | None = None, offset: int = 0
+) -> list[Room]:
+    rooms = data_interface.read_all(limit, offset)
+    return [Room.model_construct(**room) for room in rooms]
 
 
 def read_room(room_id: str, data_interface: DataInterface) -> Room:
     room = data_interface.read_by_id(room_id)
-    return Room(**room)
+    return Room.model_construct(**room)
 
 
 def create_room(data: RoomCreate, data_interface: DataInterface) -> Room:
     room_data = data.model_dump()
-    room_data["id"] = str(uuid.uuid4())
     created = data_interface.create(room_data)
-    return Room(**created)
+    return Room.model_construct(**created)
 
 
 def update_room(
@@ -35,7 +38,7 @@ def update_room(
 ) -> Room:
     update_data = data.model_dump(exclude_none=True)
     updated = data_interface.update(room_id, update_data)
-    return Room(**updated)
+    return Room.model_construct(**updated)
 
 
 def delete_room(room_id: str, data_interface: DataInterface) -> None:
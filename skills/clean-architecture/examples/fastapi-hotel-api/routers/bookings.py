@@ -2,30 +2,47 @@
 
 Intentional upgrades from transcript:
   - Same router-level upgrades as rooms.py (see rooms.py docstring)
+  - create_booking shares one session between the room lookup and the insert,
+    so both run in a single transaction with a single commit
+  - DBBookingInterface joins rooms so bookings come back with their room number
+  - Data interfaces provided by dependencies, as in rooms.py; FastAPI resolves
+    SessionDep once per request, so both interfaces use the same session
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
 
-from db.database import SessionLocal
+from fastapi import APIRouter, Depends, HTTPException
+
+from db.booking_interface import DBBookingInterface
+from db.database import SessionDep
 from db.db_interface import DBInterface
-from db.models import DBBooking, DBRoom
+from db.models import DBRoom
 from models.booking import Booking, BookingCreate
 from operations import booking as booking_ops
+from operations.interface import DataInterface
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
 
+def get_booking_interface(session: SessionDep) -> DataInterface:
+    return DBBookingInterface(session)
+
+
+def get_room_interface(session: SessionDep) -> DataInterface:
+    return DBInterface(session, DBRoom)
+
+
+BookingInterfaceDep = Annotated[DataInterface, Depends(get_booking_interface)]
+RoomInterfaceDep = Annotated[DataInterface, Depends(get_room_interface)]
+
+
 @router.get("/", response_model=list[Booking])
-def read_all_bookings() -> list[Booking]:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBBooking)
+def read_all_bookings(data_interface: BookingInterfaceDep) -> list[Booking]:
     return booking_ops.read_all_bookings(data_interface)
 
 
 @router.get("/{booking_id}", response_model=Booking)
-def read_booking(booking_id: str) -> Booking:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBBooking)
+def read_booking(booking_id: str, data_interface: BookingInterfaceDep) -> Booking:
     try:
         return booking_ops.read_booking(booking_id, data_interface)
     except KeyError:
@@ -35,10 +52,11 @@ def read_booking(booking_id: str) -> Booking:
 
 
 @router.post("/", response_model=Booking, status_code=201)
-def create_booking(data: BookingCreate) -> Booking:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBBooking)
-    room_interface = DBInterface(session, DBRoom)
+def create_booking(
+    data: BookingCreate,
+    data_interface: BookingInterfaceDep,
+    room_interface: RoomInterfaceDep,
+) -> Booking:
     try:
         return booking_ops.create_booking(data, data_interface, room_interface)
     except KeyError:
@@ -46,9 +64,7 @@ def create_booking(data: BookingCreate) -> Booking:
 
 
 @router.delete("/{booking_id}", status_code=204)
-def delete_booking(booking_id: str) -> None:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBBooking)
+def delete_booking(booking_id: str, data_interface: BookingInterfaceDep) -> None:
     try:
         booking_ops.delete_booking(booking_id, data_interface)
     except KeyError:
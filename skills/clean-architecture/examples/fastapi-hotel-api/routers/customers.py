@@ -1,31 +1,38 @@
 """Customer endpoints — composition root for customer operations.
 
 Intentional upgrades from transcript:
-  - Same router-level upgrades as rooms.py (see rooms.py docstring)
+  - Same router-level upgrades as rooms.py (see rooms.py docstring), including
+    the data interface dependency
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
 
-from db.database import SessionLocal
+from fastapi import APIRouter, Depends, HTTPException
+
+from db.database import SessionDep
 from db.db_interface import DBInterface
 from db.models import DBCustomer
 from models.customer import Customer, CustomerCreate
 from operations import customer as customer_ops
+from operations.interface import DataInterface
 
 router = APIRouter(prefix="/customers", tags=["customers"])
 
 
+def get_customer_interface(session: SessionDep) -> DataInterface:
+    return DBInterface(session, DBCustomer)
+
+
+CustomerInterfaceDep = Annotated[DataInterface, Depends(get_customer_interface)]
+
+
 @router.get("/", response_model=list[Customer])
-def read_all_customers() -> list[Customer]:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBCustomer)
+def read_all_customers(data_interface: CustomerInterfaceDep) -> list[Customer]:
     return customer_ops.read_all_customers(data_interface)
 
 
 @router.get("/{customer_id}", response_model=Customer)
-def read_customer(customer_id: str) -> Customer:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBCustomer)
+def read_customer(customer_id: str, data_interface: CustomerInterfaceDep) -> Customer:
     try:
         return customer_ops.read_customer(customer_id, data_interface)
     except KeyError:
@@ -35,16 +42,14 @@ def read_customer(customer_id: str) -> Customer:
 
 
 @router.post("/", response_model=Customer, status_code=201)
-def create_customer(data: CustomerCreate) -> Customer:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBCustomer)
+def create_customer(
+    data: CustomerCreate, data_interface: CustomerInterfaceDep
+) -> Customer:
     return customer_ops.create_customer(data, data_interface)
 
 
 @router.delete("/{customer_id}", status_code=204)
-def delete_customer(customer_id: str) -> None:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBCustomer)
+def delete_customer(customer_id: str, data_interface: CustomerInterfaceDep) -> None:
     try:
         customer_ops.delete_customer(customer_id, data_interface)
     except KeyError:
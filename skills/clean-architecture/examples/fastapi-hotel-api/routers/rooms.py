@@ -6,48 +6,80 @@ Intentional upgrades from transcript:
   - Explicit status_code (201, 204) on create/delete routes
   - response_model declarations for automatic serialization
   - Function names without api_ prefix (transcript used api_read_all_rooms etc.)
-  - Session created per-request and injected (transcript used global db_session)
+  - Session injected per-request via SessionDep and closed once the handler
+    returns (transcript used global db_session)
+  - Handlers are deliberately plain def: DBInterface wraps a blocking SQLAlchemy
+    Session, so FastAPI runs each handler in its threadpool and the event loop
+    stays free. Switch to async def only together with an async database layer
+    (tests/test_routers.py fails on async handlers unless AsyncSession is used)
+  - Room reads go through CachedDataInterface: the catalog changes only on
+    POST/PUT/DELETE, which clear ROOM_CACHE
+  - get_room_interface dependency builds the per-request data interface, so
+    handlers receive it ready-made instead of repeating the setup lines
+  - GET /rooms/ is paginated (limit 1-500, default 50; offset), so response size
+    stays bounded as the catalog grows
+  - GET endpoints send an ETag and return 304 on a matching If-None-Match
+    (see etag.py)
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
 
-from db.database import SessionLocal
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+
+from db.database import SessionDep
 from db.db_interface import DBInterface
 from db.models import DBRoom
+from etag import json_response_with_etag
 from models.room import Room, RoomCreate, RoomUpdate
 from operations import room as room_ops
+from operations.cached_interface import CachedDataInterface, ReadCache
+from operations.interface import DataInterface
 
 router = APIRouter(prefix="/rooms", tags=["rooms"])
 
+ROOM_CACHE = ReadCache()
+ROOM_LIST_ADAPTER = TypeAdapter(list[Room])
+
+
+def get_room_interface(session: SessionDep) -> DataInterface:
+    return CachedDataInterface(DBInterface(session, DBRoom), ROOM_CACHE)
+
+
+RoomInterfaceDep = Annotated[DataInterface, Depends(get_room_interface)]
+
 
 @router.get("/", response_model=list[Room])
-def read_all_rooms() -> list[Room]:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBRoom)
-    return room_ops.read_all_rooms(data_interface)
+def read_all_rooms(
+    request: Request,
+    data_interface: RoomInterfaceDep,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    offset: Annotated[int, Query(ge=0)] = 0,
+) -> Response:
+    rooms = room_ops.read_all_rooms(data_interface, limit, offset)
+    return json_response_with_etag(request, ROOM_LIST_ADAPTER.dump_json(rooms))
 
 
 @router.get("/{room_id}", response_model=Room)
-def read_room(room_id: str) -> Room:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBRoom)
+def read_room(
+    room_id: str, request: Request, data_interface: RoomInterfaceDep
+) -> Response:
     try:
-        return room_ops.read_room(room_id, data_interface)
+        room = room_ops.read_room(room_id, data_interface)
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Room not found: {room_id}")
+    return json_response_with_etag(request, room.model_dump_json().encode())
 
 
 @router.post("/", response_model=Room, status_code=201)
-def create_room(data: RoomCreate) -> Room:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBRoom)
+def create_room(data: RoomCreate, data_interface: RoomInterfaceDep) -> Room:
     return room_ops.create_room(data, data_interface)
 
 
 @router.put("/{room_id}", response_model=Room)
-def update_room(room_id: str, data: RoomUpdate) -> Room:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBRoom)
+def update_room(
+    room_id: str, data: RoomUpdate, data_interface: RoomInterfaceDep
+) -> Room:
     try:
         return room_ops.update_room(room_id, data, data_interface)
     except KeyError:
@@ -55,9 +87,7 @@ def update_room(room_id: str, data: RoomUpdate) -> Room:
 
 
 @router.delete("/{room_id}", status_code=204)
-def delete_room(room_id: str) -> None:
-    session = SessionLocal()
-    data_interface = DBInterface(session, DBRoom)
+def delete_room(room_id: str, data_interface: RoomInterfaceDep) -> None:
     try:
         room_ops.delete_room(room_id, data_interface)
     except KeyError:
@@ -0,0 +1,37 @@
+"""Shared pytest fixtures for the stub-based and in-memory database tests."""
+
+from collections.abc import Iterator
+
+from db.database import Base
+from operations.interface import DataInterfaceStub
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def room_stub(request: pytest.FixtureRequest) -> DataInterfaceStub:
+    """A fresh room stub holding room-1 (number 101, size 2, $150 per night).
+
+    Parametrize indirectly to set a different nightly price.
+    """
+    price = getattr(request, "param", 150)
+    stub = DataInterfaceStub()
+    stub.data["room-1"] = {"id": "room-1", "number": "101", "size": 2, "price": price}
+    return stub
+
+
+@pytest.fixture
+def db_session() -> Iterator[Session]:
+    """A session on a fresh in-memory SQLite database with all tables created."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine, expire_on_commit=False, autoflush=False) as session:
+        yield session
+    engine.dispose()
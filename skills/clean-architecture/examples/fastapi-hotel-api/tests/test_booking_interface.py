@@ -0,0 +1,55 @@
+"""Tests for DBBookingInterface against an in-memory SQLite database.
+
+Intentional upgrade: the booking/room join is new — transcript read bookings
+without their room.
+"""
+
+from datetime import date
+
+from db.booking_interface import DBBookingInterface
+from db.models import DBBooking, DBRoom
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+
+def add_booking(db_session: Session) -> None:
+    db_session.add(DBRoom(id="room-1", number="101", size=2, price=150))
+    db_session.add(
+        DBBooking(
+            id="booking-1",
+            room_id="room-1",
+            customer_id="cust-1",
+            from_date=date(2024, 12, 24),
+            to_date=date(2024, 12, 25),
+            price=150,
+        )
+    )
+    db_session.commit()
+
+
+def test_read_by_id_includes_room_number(db_session: Session) -> None:
+    add_booking(db_session)
+
+    booking = DBBookingInterface(db_session).read_by_id("booking-1")
+
+    assert booking["room_number"] == "101"
+    assert booking["price"] == 150
+
+
+def test_read_all_includes_room_number(db_session: Session) -> None:
+    add_booking(db_session)
+
+    bookings = DBBookingInterface(db_session).read_all()
+
+    assert [b["room_number"] for b in bookings] == ["101"]
+
+
+def test_booking_listed_after_room_deleted(db_session: Session) -> None:
+    add_booking(db_session)
+    db_session.execute(delete(DBRoom))
+    db_session.commit()
+    interface = DBBookingInterface(db_session)
+
+    assert [b["id"] for b in interface.read_all()] == ["booking-1"]
+    assert interface.read_by_id("booking-1")["room_number"] is None
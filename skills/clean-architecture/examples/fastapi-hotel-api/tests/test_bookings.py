@@ -12,7 +12,7 @@ Intentional upgrades from transcript:
   - Room tests in separate test_rooms.py (transcript only showed booking tests)
 """
 
-from datetime import date
+from datetime import date, timedelta
 
 from models.booking import Booking, BookingCreate
 from operations.booking import create_booking
@@ -21,53 +21,48 @@ from operations.interface import DataInterfaceStub
 import pytest
 
 
-def make_room_stub(price: int = 150) -> DataInterfaceStub:
-    """Create a room stub with a single room at the given price."""
-    stub = DataInterfaceStub()
-    stub.data["room-1"] = {
-        "id": "room-1",
-        "number": "101",
-        "size": 2,
-        "price": price,
-    }
-    return stub
-
-
-def test_price_one_night() -> None:
+@pytest.mark.parametrize(
+    ("room_stub", "nights", "expected"),
+    [
+        (150, 1, 150),  # 1 night × $150
+        (100, 5, 500),  # 5 nights × $100
+        (200, 3, 600),  # 3 nights × $200
+    ],
+    indirect=["room_stub"],
+)
+def test_price(room_stub: DataInterfaceStub, nights: int, expected: int) -> None:
     booking_stub = DataInterfaceStub()
-    room_stub = make_room_stub(price=150)
 
     data = BookingCreate(
         room_id="room-1",
         customer_id="cust-1",
-        from_date=date(2024, 12, 24),
-        to_date=date(2024, 12, 25),
+        from_date=date(2024, 12, 20),
+        to_date=date(2024, 12, 20) + timedelta(days=nights),
     )
 
     booking = create_booking(data, booking_stub, room_stub)
 
-    assert booking.price == 150  # 1 night × $150
+    assert booking.price == expected
 
 
-def test_price_multiple_nights() -> None:
+def test_booking_stored_in_stub(room_stub: DataInterfaceStub) -> None:
     booking_stub = DataInterfaceStub()
-    room_stub = make_room_stub(price=100)
 
     data = BookingCreate(
         room_id="room-1",
         customer_id="cust-1",
-        from_date=date(2024, 12, 20),
+        from_date=date(2024, 12, 24),
         to_date=date(2024, 12, 25),
     )
 
     booking = create_booking(data, booking_stub, room_stub)
 
-    assert booking.price == 500  # 5 nights × $100
+    # Verify the booking was persisted via the stub
+    assert booking.id in booking_stub.data
 
 
-def test_booking_stored_in_stub() -> None:
+def test_booking_includes_room_number(room_stub: DataInterfaceStub) -> None:
     booking_stub = DataInterfaceStub()
-    room_stub = make_room_stub(price=150)
 
     data = BookingCreate(
         room_id="room-1",
@@ -78,8 +73,7 @@ def test_booking_stored_in_stub() -> None:
 
     booking = create_booking(data, booking_stub, room_stub)
 
-    # Verify the booking was persisted via the stub
-    assert booking.id in booking_stub.data
+    assert booking.room_number == "101"
 
 
 def test_room_not_found() -> None:
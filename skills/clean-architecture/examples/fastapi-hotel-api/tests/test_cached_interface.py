@@ -0,0 +1,112 @@
+"""Tests for CachedDataInterface wrapped around DataInterfaceStub.
+
+Intentional upgrade: response caching is new — transcript had no caching layer.
+"""
+
+import threading
+
+from operations.cached_interface import CachedDataInterface, ReadCache
+from operations.interface import DataInterfaceStub
+
+import pytest
+
+
+@pytest.fixture
+def cached(room_stub: DataInterfaceStub) -> CachedDataInterface:
+    return CachedDataInterface(room_stub, ReadCache())
+
+
+def test_read_served_from_cache(
+    cached: CachedDataInterface, room_stub: DataInterfaceStub
+) -> None:
+    cached.read_by_id("room-1")
+
+    del room_stub.data["room-1"]  # bypass the cache
+
+    assert cached.read_by_id("room-1")["price"] == 150
+
+
+def test_write_clears_cache(cached: CachedDataInterface) -> None:
+    cached.read_all()
+
+    cached.create({"id": "room-2", "number": "102", "size": 4, "price": 250})
+
+    assert len(cached.read_all()) == 2
+
+
+def test_expired_entry_is_reloaded(room_stub: DataInterfaceStub) -> None:
+    cached = CachedDataInterface(room_stub, ReadCache(), ttl=-1)
+    cached.read_by_id("room-1")
+
+    room_stub.data["room-1"]["price"] = 200
+
+    assert cached.read_by_id("room-1")["price"] == 200
+
+
+def test_missing_id_not_cached(
+    cached: CachedDataInterface, room_stub: DataInterfaceStub
+) -> None:
+    with pytest.raises(KeyError):
+        cached.read_by_id("room-2")
+
+    room_stub.data["room-2"] = {
+        "id": "room-2",
+        "number": "102",
+        "size": 4,
+        "price": 250,
+    }
+    assert cached.read_by_id("room-2")["number"] == "102"
+
+
+def test_cache_size_is_bounded(room_stub: DataInterfaceStub) -> None:
+    cached = CachedDataInterface(room_stub, ReadCache(maxsize=3))
+
+    for offset in range(10):
+        cached.read_all(limit=1, offset=offset)
+
+    assert list(cached.cache.entries) == [
+        ("__all__", 1, offset) for offset in (7, 8, 9)
+    ]
+
+
+def test_expired_entries_evicted_first(room_stub: DataInterfaceStub) -> None:
+    cached = CachedDataInterface(room_stub, ReadCache(maxsize=2))
+    cached.read_by_id("room-1")
+    cached.read_all()
+    cached.cache.entries[("__all__", None, 0)] = (0.0, [])  # newer, but expired
+
+    cached.read_all(limit=1)
+
+    assert list(cached.cache.entries) == ["room-1", ("__all__", 1, 0)]
+
+
+class SlowReadInterface:
+    """Wraps a stub; read_by_id copies the row, then blocks until resumed."""
+
+    def __init__(self, data_interface: DataInterfaceStub):
+        self.data_interface = data_interface
+        self.read_started = threading.Event()
+        self.resume = threading.Event()
+
+    def __getattr__(self, name: str):
+        return getattr(self.data_interface, name)
+
+    def read_by_id(self, id: str) -> dict:
+        obj = dict(self.data_interface.read_by_id(id))
+        self.read_started.set()
+        self.resume.wait(timeout=5)
+        return obj
+
+
+def test_read_racing_a_write_is_not_cached(room_stub: DataInterfaceStub) -> None:
+    slow = SlowReadInterface(room_stub)
+    cached = CachedDataInterface(slow, ReadCache())
+    reader = threading.Thread(target=cached.read_by_id, args=("room-1",))
+    reader.start()
+    slow.read_started.wait(timeout=5)
+
+    cached.update("room-1", {"price": 200})  # lands while the read is in flight
+    slow.resume.set()
+    reader.join(timeout=5)
+
+    assert cached.read_by_id("room-1")["price"] == 200
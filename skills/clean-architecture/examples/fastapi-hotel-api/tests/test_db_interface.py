@@ -0,0 +1,74 @@
+"""Tests for DBInterface against an in-memory SQLite database.
+
+Intentional upgrade: DB-layer tests are new — transcript only tested operations
+with stubs.
+"""
+
+from db.db_interface import DBInterface
+from db.models import DBRoom
+
+import pytest
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def rooms(db_session: Session) -> DBInterface:
+    return DBInterface(db_session, DBRoom)
+
+
+def test_create_returns_row_with_generated_id(rooms: DBInterface) -> None:
+    room = rooms.create({"number": "101", "size": 2, "price": 150})
+
+    assert room["id"]
+    assert rooms.read_by_id(room["id"]) == room
+
+
+def test_create_many(rooms: DBInterface) -> None:
+    created = rooms.create_many(
+        [{"number": f"10{n}", "size": 2, "price": 150} for n in range(1, 4)]
+    )
+
+    assert [room["number"] for room in created] == ["101", "102", "103"]
+    assert rooms.read_all() == created  # primary keys follow insertion order
+
+
+def test_create_many_empty(rooms: DBInterface) -> None:
+    assert rooms.create_many([]) == []
+
+
+def test_update_returns_updated_row(rooms: DBInterface) -> None:
+    room = rooms.create({"number": "101", "size": 2, "price": 150})
+
+    updated = rooms.update(room["id"], {"price": 200})
+
+    assert updated == {**room, "price": 200}
+    assert rooms.read_by_id(room["id"])["price"] == 200
+
+
+def test_update_without_changes_returns_row(rooms: DBInterface) -> None:
+    room = rooms.create({"number": "101", "size": 2, "price": 150})
+
+    assert rooms.update(room["id"], {}) == room
+
+
+@pytest.mark.parametrize("data", [{"price": 200}, {}])
+def test_update_not_found(rooms: DBInterface, data: dict) -> None:
+    with pytest.raises(KeyError):
+        rooms.update("nonexistent", data)
+
+
+def test_read_all_paginated(rooms: DBInterface) -> None:
+    created = rooms.create_many(
+        [{"number": f"10{n}", "size": 2, "price": 150} for n in range(1, 6)]
+    )
+
+    assert rooms.read_all(limit=2, offset=1) == created[1:3]
+
+
+def test_delete(rooms: DBInterface) -> None:
+    room = rooms.create({"number": "101", "size": 2, "price": 150})
+
+    rooms.delete(room["id"])
+
+    with pytest.raises(KeyError):
+        rooms.read_by_id(room["id"])
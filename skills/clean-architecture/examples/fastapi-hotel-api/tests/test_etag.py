@@ -0,0 +1,58 @@
+"""Tests for the ETag / If-None-Match helpers.
+
+Intentional upgrade: conditional GET is new — transcript had no HTTP caching.
+"""
+
+from etag import etag_matches, json_response_with_etag, make_etag
+
+import pytest
+from fastapi import Request
+
+BODY = b'{"id":"room-1"}'
+ETAG = make_etag(BODY)
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+def test_make_etag_is_quoted_and_stable() -> None:
+    assert ETAG.startswith('"') and ETAG.endswith('"')
+    assert make_etag(BODY) == ETAG
+    assert make_etag(b"{}") != ETAG
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        (ETAG, True),
+        (f"W/{ETAG}", True),
+        (f'"other", {ETAG}', True),
+        ('"other", "another"', False),
+        ("*", True),
+    ],
+    ids=["no-header", "match", "weak-match", "list", "no-match", "wildcard"],
+)
+def test_etag_matches(header: str | None, expected: bool) -> None:
+    assert etag_matches(make_request(header), ETAG) is expected
+
+
+def test_response_carries_body_and_etag() -> None:
+    response = json_response_with_etag(make_request(), BODY)
+
+    assert response.status_code == 200
+    assert response.body == BODY
+    assert response.headers["etag"] == ETAG
+    assert response.media_type == "application/json"
+
+
+def test_matching_request_gets_empty_304() -> None:
+    response = json_response_with_etag(make_request(ETAG), BODY)
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == ETAG
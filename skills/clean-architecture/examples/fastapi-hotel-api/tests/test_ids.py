@@ -0,0 +1,23 @@
+"""Tests for identifier generation.
+
+Intentional upgrade: IDs are time-ordered UUIDv7 strings (transcript relied on
+DB autoincrement).
+"""
+
+import uuid
+
+from ids import new_id
+
+
+def test_new_id_is_uuid7() -> None:
+    parsed = uuid.UUID(new_id())
+
+    assert parsed.version == 7
+    assert parsed.variant == uuid.RFC_4122
+
+
+def test_new_ids_strictly_increase() -> None:
+    ids = [new_id() for _ in range(10_000)]  # many share a millisecond
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
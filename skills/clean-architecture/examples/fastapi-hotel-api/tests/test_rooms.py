@@ -22,16 +22,8 @@ def test_create_room() -> None:
     assert room.id is not None
 
 
-def test_read_room() -> None:
-    stub = DataInterfaceStub()
-    stub.data["room-1"] = {
-        "id": "room-1",
-        "number": "101",
-        "size": 2,
-        "price": 150,
-    }
-
-    room = read_room("room-1", stub)
+def test_read_room(room_stub: DataInterfaceStub) -> None:
+    room = read_room("room-1", room_stub)
 
     assert room == Room(id="room-1", number="101", size=2, price=150)
 
@@ -43,21 +35,42 @@ def test_read_room_not_found() -> None:
         read_room("nonexistent", stub)
 
 
-def test_read_all_rooms() -> None:
-    stub = DataInterfaceStub()
-    stub.data["room-1"] = {"id": "room-1", "number": "101", "size": 2, "price": 150}
-    stub.data["room-2"] = {"id": "room-2", "number": "102", "size": 4, "price": 250}
+def test_read_all_rooms(room_stub: DataInterfaceStub) -> None:
+    room_stub.data["room-2"] = {
+        "id": "room-2",
+        "number": "102",
+        "size": 4,
+        "price": 250,
+    }
 
-    rooms = read_all_rooms(stub)
+    rooms = read_all_rooms(room_stub)
 
     assert len(rooms) == 2
 
 
-def test_update_room() -> None:
-    stub = DataInterfaceStub()
-    stub.data["room-1"] = {"id": "room-1", "number": "101", "size": 2, "price": 150}
+def test_read_all_rooms_paginated(room_stub: DataInterfaceStub) -> None:
+    for n in range(2, 6):
+        room_stub.data[f"room-{n}"] = {
+            "id": f"room-{n}",
+            "number": f"10{n}",
+            "size": 2,
+            "price": 150,
+        }
+
+    rooms = read_all_rooms(room_stub, limit=2, offset=1)
 
-    updated = update_room("room-1", RoomUpdate(price=200), stub)
+    assert [room.id for room in rooms] == ["room-2", "room-3"]
+
+
+def test_update_room(room_stub: DataInterfaceStub) -> None:
+    updated = update_room("room-1", RoomUpdate(price=200), room_stub)
 
     assert updated.price == 200
     assert updated.number == "101"  # unchanged
+
+
+def test_update_room_not_found() -> None:
+    stub = DataInterfaceStub()
+
+    with pytest.raises(KeyError):
+        update_room("nonexistent", RoomUpdate(price=200), stub)
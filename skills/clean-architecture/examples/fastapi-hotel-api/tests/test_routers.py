@@ -0,0 +1,48 @@
+"""Static checks on the router modules — no FastAPI app or database needed.
+
+Intentional upgrade: new — guards the sync-handler decision documented in
+routers/rooms.py. DBInterface wraps a blocking Session, so an async def handler
+would run that blocking I/O on the event loop.
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+ROUTERS_DIR = Path(__file__).resolve().parent.parent / "routers"
+HTTP_METHODS = {"get", "post", "put", "patch", "delete"}
+
+
+def is_route_handler(node: ast.AST) -> bool:
+    return isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and any(
+        isinstance(dec, ast.Call)
+        and isinstance(dec.func, ast.Attribute)
+        and dec.func.attr in HTTP_METHODS
+        for dec in node.decorator_list
+    )
+
+
+def imports_async_session(tree: ast.Module) -> bool:
+    return any(
+        isinstance(node, ast.ImportFrom)
+        and any(alias.name == "AsyncSession" for alias in node.names)
+        for node in ast.walk(tree)
+    )
+
+
+@pytest.mark.parametrize(
+    "path", sorted(ROUTERS_DIR.glob("*.py")), ids=lambda path: path.name
+)
+def test_handlers_are_sync_without_async_session(path: Path) -> None:
+    tree = ast.parse(path.read_text())
+    if imports_async_session(tree):
+        pytest.skip("module uses an async database session")
+
+    async_handlers = [
+        node.name
+        for node in ast.walk(tree)
+        if is_route_handler(node) and isinstance(node, ast.AsyncFunctionDef)
+    ]
+
+    assert async_handlers == []